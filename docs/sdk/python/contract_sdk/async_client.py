@@ -0,0 +1,479 @@
+"""
+Async client for the Contract Management API
+
+Mirrors ContractManagementClient on top of httpx.AsyncClient so fan-out
+read workloads (list contracts, then fetch each) can run concurrently
+on a single event loop instead of serializing round trips.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "AsyncContractManagementClient requires the optional httpx "
+        "dependency: pip install httpx"
+    ) from e
+
+from .client import (
+    APIError,
+    AuthenticationError,
+    NetworkError,
+    _dumps,
+    _raise_api_error,
+    _token_expiry,
+    __version__
+)
+
+
+class AsyncContractManagementClient:
+    """
+    Async client for interacting with the Contract Management API
+
+    Args:
+        base_url: Base URL of the API
+        api_key: Optional API key for authentication
+        access_token: Optional access token for authentication
+        timeout: Request timeout in seconds
+        verify_ssl: Whether to verify SSL certificates
+        pool_connections: Maximum number of keep-alive connections
+        pool_maxsize: Maximum number of connections
+        http2: Multiplex API calls over HTTP/2 (requires httpx[http2])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        pool_connections: int = 20,
+        pool_maxsize: int = 50,
+        http2: bool = False
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.access_token = access_token
+        self.refresh_token = None
+        self._refresh_lock = asyncio.Lock()
+        self._token_expiry = _token_expiry(access_token) if access_token else float('inf')
+
+        headers = {'User-Agent': f'ContractManagementSDK-Python/{__version__}'}
+        if api_key:
+            headers['X-API-Key'] = api_key
+        if access_token:
+            headers['Authorization'] = f'Bearer {access_token}'
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            verify=verify_ssl,
+            headers=headers,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_connections,
+                max_connections=pool_maxsize
+            )
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Any:
+        """Make HTTP request to the API"""
+        url = self.base_url + endpoint
+
+        # Proactively refresh an expiring token; the asyncio.Lock makes
+        # sure only one coroutine hits /auth/refresh
+        if (self.refresh_token and endpoint != '/auth/refresh'
+                and time.time() > self._token_expiry - 30):
+            async with self._refresh_lock:
+                if time.time() > self._token_expiry - 30:
+                    await self._refresh_access_token()
+
+        kwargs = {'params': params}
+        if data is not None:
+            kwargs['content'] = _dumps(data)
+            kwargs['headers'] = {'Content-Type': 'application/json'}
+            if method == 'POST':
+                # One key per logical write; the 401 re-issue below resends
+                # the same header so the server can dedupe replayed POSTs
+                kwargs['headers']['Idempotency-Key'] = str(uuid.uuid4())
+
+        try:
+            response = await self._client.request(method, url, **kwargs)
+
+            # Handle token refresh
+            if response.status_code == 401 and self.refresh_token:
+                await self._refresh_access_token()
+                response = await self._client.request(method, url, **kwargs)
+
+            if response.status_code >= 400:
+                _raise_api_error(response)
+                return None
+
+            if response.content:
+                return response.json()
+            return None
+
+        except httpx.ConnectError as e:
+            raise NetworkError(f"Connection error: {str(e)}")
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Request timeout: {str(e)}")
+        except httpx.HTTPError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    async def _refresh_access_token(self):
+        """Refresh the access token using refresh token"""
+        if not self.refresh_token:
+            raise AuthenticationError("No refresh token available")
+
+        data = await self._make_request('POST', '/auth/refresh', {
+            'refreshToken': self.refresh_token
+        })
+
+        self.access_token = data['accessToken']
+        self.refresh_token = data['refreshToken']
+        self._token_expiry = _token_expiry(self.access_token)
+        self._client.headers['Authorization'] = f'Bearer {self.access_token}'
+
+    # Authentication Methods
+
+    async def login(self, email: str, password: str, two_factor_code: Optional[str] = None) -> Dict:
+        """Login to the system"""
+        data = {
+            'email': email,
+            'password': password
+        }
+
+        if two_factor_code:
+            data['twoFactorCode'] = two_factor_code
+
+        response = await self._make_request('POST', '/auth/login', data)
+
+        self.access_token = response['accessToken']
+        self.refresh_token = response['refreshToken']
+        self._token_expiry = _token_expiry(self.access_token)
+        self._client.headers['Authorization'] = f'Bearer {self.access_token}'
+
+        return response
+
+    async def logout(self):
+        """Logout from the system"""
+        try:
+            await self._make_request('POST', '/auth/logout')
+        finally:
+            self.access_token = None
+            self.refresh_token = None
+            self._client.headers.pop('Authorization', None)
+
+    async def get_current_user(self) -> Dict:
+        """Get current user information"""
+        return await self._make_request('GET', '/users/me')
+
+    # Contract Methods
+
+    async def get_contracts(
+        self,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20,
+        sort_by: str = 'createdAt',
+        sort_order: str = 'desc'
+    ) -> Dict:
+        """Get list of contracts"""
+        params = {
+            'page': page,
+            'limit': limit,
+            'sortBy': sort_by,
+            'sortOrder': sort_order
+        }
+
+        if status:
+            params['status'] = status
+        if type:
+            params['type'] = type
+        if search:
+            params['search'] = search
+
+        return await self._make_request('GET', '/contracts', params=params)
+
+    async def get_contract(self, contract_id: str) -> Dict:
+        """Get contract by ID"""
+        return await self._make_request('GET', f'/contracts/{contract_id}')
+
+    async def get_contracts_batch(self, contract_ids: List[str]) -> List[Dict]:
+        """Get multiple contracts in a single request"""
+        try:
+            return await self._make_request('POST', '/contracts:batchGet', {
+                'ids': contract_ids
+            })
+        except APIError as e:
+            if e.status_code == 404:
+                return await self.get_contracts_parallel(contract_ids)
+            raise
+
+    async def get_contracts_parallel(self, contract_ids: List[str]) -> List[Dict]:
+        """Fetch multiple contracts concurrently"""
+        return list(await asyncio.gather(
+            *(self.get_contract(contract_id) for contract_id in contract_ids)
+        ))
+
+    async def create_contract(
+        self,
+        title: str,
+        type: str,
+        description: Optional[str] = None,
+        value: Optional[float] = None,
+        currency: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        content: Optional[str] = None,
+        parties: Optional[List[Dict]] = None,
+        metadata: Optional[Dict] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict:
+        """Create a new contract"""
+        data = {
+            'title': title,
+            'type': type
+        }
+
+        if description:
+            data['description'] = description
+        if value is not None:
+            data['value'] = value
+        if currency:
+            data['currency'] = currency
+        if start_date:
+            data['startDate'] = start_date
+        if end_date:
+            data['endDate'] = end_date
+        if content:
+            data['content'] = content
+        if parties:
+            data['parties'] = parties
+        if metadata:
+            data['metadata'] = metadata
+        if tags:
+            data['tags'] = tags
+
+        return await self._make_request('POST', '/contracts', data)
+
+    async def update_contract(self, contract_id: str, **kwargs) -> Dict:
+        """Update contract"""
+        return await self._make_request('PUT', f'/contracts/{contract_id}', kwargs)
+
+    async def delete_contract(self, contract_id: str):
+        """Delete contract"""
+        await self._make_request('DELETE', f'/contracts/{contract_id}')
+
+    async def get_contract_versions(self, contract_id: str) -> List[Dict]:
+        """Get contract version history"""
+        return await self._make_request('GET', f'/contracts/{contract_id}/versions')
+
+    async def compare_contract_versions(
+        self,
+        contract_id: str,
+        version1: int,
+        version2: int
+    ) -> Dict:
+        """Compare two contract versions"""
+        return await self._make_request('POST', f'/contracts/{contract_id}/compare', {
+            'version1': version1,
+            'version2': version2
+        })
+
+    # Contract Actions
+
+    async def submit_for_approval(
+        self,
+        contract_id: str,
+        approvers: List[str],
+        message: Optional[str] = None
+    ) -> Dict:
+        """Submit contract for approval"""
+        data = {'approvers': approvers}
+        if message:
+            data['message'] = message
+
+        return await self._make_request('POST', f'/contracts/{contract_id}/submit-approval', data)
+
+    async def approve_contract(self, contract_id: str, comments: Optional[str] = None) -> Dict:
+        """Approve contract"""
+        data = {}
+        if comments:
+            data['comments'] = comments
+
+        return await self._make_request('POST', f'/contracts/{contract_id}/approve', data)
+
+    async def reject_contract(self, contract_id: str, reason: str) -> Dict:
+        """Reject contract"""
+        return await self._make_request('POST', f'/contracts/{contract_id}/reject', {
+            'reason': reason
+        })
+
+    async def sign_contract(self, contract_id: str, signature_data: Dict) -> Dict:
+        """Sign contract"""
+        return await self._make_request('POST', f'/contracts/{contract_id}/sign', signature_data)
+
+    # Comment Methods
+
+    async def get_comments(self, contract_id: str) -> List[Dict]:
+        """Get contract comments"""
+        return await self._make_request('GET', f'/contracts/{contract_id}/comments')
+
+    async def add_comment(
+        self,
+        contract_id: str,
+        content: str,
+        parent_id: Optional[str] = None,
+        position: Optional[Dict] = None,
+        mentions: Optional[List[str]] = None
+    ) -> Dict:
+        """Add comment to contract"""
+        data = {'content': content}
+
+        if parent_id:
+            data['parentId'] = parent_id
+        if position:
+            data['position'] = position
+        if mentions:
+            data['mentions'] = mentions
+
+        return await self._make_request('POST', f'/contracts/{contract_id}/comments', data)
+
+    async def update_comment(self, contract_id: str, comment_id: str, content: str) -> Dict:
+        """Update comment"""
+        return await self._make_request('PUT', f'/contracts/{contract_id}/comments/{comment_id}', {
+            'content': content
+        })
+
+    async def delete_comment(self, contract_id: str, comment_id: str):
+        """Delete comment"""
+        await self._make_request('DELETE', f'/contracts/{contract_id}/comments/{comment_id}')
+
+    # Template Methods
+
+    async def get_templates(
+        self,
+        category: Optional[str] = None,
+        is_public: Optional[bool] = None,
+        search: Optional[str] = None,
+        page: int = 1,
+        limit: int = 20
+    ) -> Dict:
+        """Get list of templates"""
+        params = {
+            'page': page,
+            'limit': limit
+        }
+
+        if category:
+            params['category'] = category
+        if is_public is not None:
+            params['isPublic'] = is_public
+        if search:
+            params['search'] = search
+
+        return await self._make_request('GET', '/templates', params=params)
+
+    async def get_template(self, template_id: str) -> Dict:
+        """Get template by ID"""
+        return await self._make_request('GET', f'/templates/{template_id}')
+
+    async def create_template(
+        self,
+        name: str,
+        category: str,
+        content: str,
+        description: Optional[str] = None,
+        variables: Optional[List[Dict]] = None,
+        tags: Optional[List[str]] = None,
+        is_public: bool = False,
+        price: Optional[float] = None
+    ) -> Dict:
+        """Create a new template"""
+        data = {
+            'name': name,
+            'category': category,
+            'content': content,
+            'isPublic': is_public
+        }
+
+        if description:
+            data['description'] = description
+        if variables:
+            data['variables'] = variables
+        if tags:
+            data['tags'] = tags
+        if price is not None:
+            data['price'] = price
+
+        return await self._make_request('POST', '/templates', data)
+
+    async def update_template(self, template_id: str, **kwargs) -> Dict:
+        """Update template"""
+        return await self._make_request('PUT', f'/templates/{template_id}', kwargs)
+
+    async def delete_template(self, template_id: str):
+        """Delete template"""
+        await self._make_request('DELETE', f'/templates/{template_id}')
+
+    # Analytics Methods
+
+    async def get_dashboard_analytics(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict:
+        """Get dashboard analytics"""
+        params = {}
+
+        if start_date:
+            params['startDate'] = start_date.isoformat()
+        if end_date:
+            params['endDate'] = end_date.isoformat()
+
+        return await self._make_request('GET', '/analytics/dashboard', params=params)
+
+    async def get_contract_analytics(self, contract_id: str) -> Dict:
+        """Get contract analytics"""
+        return await self._make_request('GET', f'/analytics/contracts/{contract_id}')
+
+    # Utility Methods
+
+    async def search_contracts(self, query: str) -> List[Dict]:
+        """Search contracts"""
+        return await self._make_request('GET', '/contracts/search', params={'q': query})
+
+    async def bulk_update_contracts(
+        self,
+        contract_ids: List[str],
+        updates: Dict
+    ) -> List[Dict]:
+        """Bulk update contracts"""
+        return await self._make_request('POST', '/contracts/bulk-update', {
+            'contractIds': contract_ids,
+            'updates': updates
+        })
+
+    async def close(self):
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -4,22 +4,113 @@ Contract Management System Python SDK
 A Python client library for interacting with the Contract Management API.
 """
 
+import base64
+import functools
 import json
+import os
+import random
+import re
+import shutil
+import threading
 import time
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any, Callable, BinaryIO
 from datetime import datetime
-from urllib.parse import urljoin
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from urllib3.util.retry import Retry
+
+try:
+    from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:
+    MultipartEncoder = None
+    MultipartEncoderMonitor = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Advertise only codings urllib3 can actually decode: it appends br/zstd
+# to its own Accept-Encoding constant when the optional decoders are
+# usable (zstd needs urllib3 >= 2.0 plus zstandard). brotli/zstandard are
+# optional extras (contract-management-sdk[compression])
+try:
+    from urllib3.util.request import ACCEPT_ENCODING as _URLLIB3_CODINGS
+except ImportError:
+    _URLLIB3_CODINGS = 'gzip,deflate'
+_ACCEPT_ENCODING = ', '.join(
+    coding for coding in ('zstd', 'br', 'gzip', 'deflate')
+    if coding in {c.strip() for c in _URLLIB3_CODINGS.split(',')}
+)
+
+if httpx is not None:
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
 
 
 __version__ = "1.0.0"
 
+_FILENAME_RE = re.compile(r'filename="?([^"]+)"?')
+
+
+def _token_expiry(token: str) -> float:
+    """Best-effort extraction of the exp claim from a JWT access token"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims['exp'])
+    except (IndexError, KeyError, ValueError, TypeError):
+        # Opaque token or no exp claim; fall back to reactive 401 handling
+        return float('inf')
+
+
+def _raise_api_error(response: Any):
+    """Map an API error response onto the SDK exception hierarchy"""
+    try:
+        error_data = response.json()
+        message = error_data.get('message', 'An error occurred')
+        code = error_data.get('code', 'UNKNOWN_ERROR')
+        details = error_data.get('details')
+    except:
+        message = f"HTTP {response.status_code}: {response.text}"
+        code = f"HTTP_{response.status_code}"
+        details = None
+
+    if response.status_code == 401:
+        raise AuthenticationError(message, code, response.status_code, details)
+    elif response.status_code == 400:
+        raise ValidationError(message, code, response.status_code, details)
+    else:
+        raise APIError(message, code, response.status_code, details)
+
 
 class APIError(Exception):
     """Base exception for API errors"""
-    
+
+    __slots__ = ('message', 'code', 'status_code', 'details')
+
     def __init__(self, message: str, code: str = None, status_code: int = None, details: Any = None):
         super().__init__(message)
         self.message = message
@@ -30,17 +121,17 @@ class APIError(Exception):
 
 class AuthenticationError(APIError):
     """Raised when authentication fails"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(APIError):
     """Raised when request validation fails"""
-    pass
+    __slots__ = ()
 
 
 class NetworkError(APIError):
     """Raised when network issues occur"""
-    pass
+    __slots__ = ()
 
 
 class ContractManagementClient:
@@ -54,8 +145,11 @@ class ContractManagementClient:
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts
         verify_ssl: Whether to verify SSL certificates
+        pool_connections: Number of connection pools to cache
+        pool_maxsize: Maximum number of connections per pool
+        http2: Multiplex API calls over HTTP/2 (requires httpx[http2])
     """
-    
+
     def __init__(
         self,
         base_url: str,
@@ -63,7 +157,10 @@ class ContractManagementClient:
         access_token: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        pool_connections: int = 20,
+        pool_maxsize: int = 50,
+        http2: bool = False
     ):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -71,27 +168,182 @@ class ContractManagementClient:
         self.refresh_token = None
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        
+        self._batch = None
+        self._etag_cache: Dict[Any, tuple] = {}
+        self._refresh_lock = threading.Lock()
+        self._token_expiry = _token_expiry(access_token) if access_token else float('inf')
+        self._max_retries = max_retries
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pid = os.getpid()
+
         # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+        self.session = self._build_session()
+        self._upload_session = self._build_upload_session()
+
+        # Pre-bound request verbs; skips re-binding _make_request and its
+        # method-string dispatch on every public call
+        self._get = functools.partial(self._make_request, 'GET')
+        self._post = functools.partial(self._make_request, 'POST')
+        self._put = functools.partial(self._make_request, 'PUT')
+        self._delete = functools.partial(self._make_request, 'DELETE')
+
+        # Optional HTTP/2 transport; multiplexes concurrent calls over a
+        # single TLS connection. Streaming and multipart requests stay on
+        # the requests session.
+        self._http2_client = None
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires the optional httpx dependency: "
+                    "pip install 'httpx[http2]'"
+                )
+            self._http2_client = self._build_http2_client()
+
+    def _build_session(self) -> requests.Session:
+        """Build a configured requests.Session with retry and pooling"""
+        session = requests.Session()
+        try:
+            retry_strategy = Retry(
+                total=self._max_retries,
+                backoff_factor=1.0,
+                backoff_max=30,
+                backoff_jitter=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(
+                    ['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'POST']
+                ),
+                respect_retry_after_header=True,
+            )
+        except TypeError:
+            # urllib3 < 2.0 lacks backoff_max/backoff_jitter kwargs
+            retry_strategy = Retry(
+                total=self._max_retries,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(
+                    ['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'POST']
+                ),
+                respect_retry_after_header=True,
+            )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Set default headers
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': f'ContractManagementSDK-Python/{__version__}'
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Set default headers; Content-Type is set per-request only when
+        # a JSON body is actually sent
+        session.headers.update({
+            'User-Agent': f'ContractManagementSDK-Python/{__version__}',
+            'Accept-Encoding': _ACCEPT_ENCODING
         })
-        
+
         if self.api_key:
-            self.session.headers['X-API-Key'] = self.api_key
-            
+            session.headers['X-API-Key'] = self.api_key
+        if self.access_token:
+            session.headers['Authorization'] = f'Bearer {self.access_token}'
+
+        return session
+
+    def _build_upload_session(self) -> requests.Session:
+        """
+        Session for streaming uploads
+
+        The multipart encoder is forward-only, so status/read retries
+        that would resend a consumed body are disabled; connect retries,
+        which fire before any body is sent, are kept. Auth headers are
+        merged in from the main session per call.
+        """
+        session = requests.Session()
+        retry_strategy = Retry(
+            total=self._max_retries,
+            connect=self._max_retries,
+            read=0,
+            backoff_factor=1.0,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _build_http2_client(self):
+        """Build the optional HTTP/2 client (also used after fork)"""
+        return httpx.Client(
+            timeout=self.timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=self.verify_ssl,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self._pool_connections,
+                    max_connections=self._pool_maxsize
+                ),
+                retries=self._max_retries
+            )
+        )
+
+    def _ensure_session(self):
+        """Rebuild transports after a fork; connection pools are not fork-safe"""
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self.session = self._build_session()
+            self._upload_session = self._build_upload_session()
+            if self._http2_client is not None:
+                self._http2_client = self._build_http2_client()
+
+    def close(self):
+        """Close the underlying HTTP connection pools"""
+        self.session.close()
+        self._upload_session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        """Issue one HTTP request through the configured transport"""
+        if (self._http2_client is not None and not kwargs.get('stream')
+                and 'files' not in kwargs):
+            headers = dict(self.session.headers)
+            headers.update(kwargs.get('headers') or {})
+            # Let httpx negotiate compression it can decode itself; the
+            # session value reflects urllib3's decoders, not httpx's
+            headers.pop('Accept-Encoding', None)
+            # httpx has no urllib3-style status retries, so mirror the
+            # session's policy here: retry 429/5xx with Retry-After or
+            # jittered exponential backoff capped at 30s
+            for attempt in range(self._max_retries + 1):
+                response = self._http2_client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=kwargs.get('params'),
+                    content=kwargs.get('data')
+                )
+                if (response.status_code not in (429, 500, 502, 503, 504)
+                        or attempt == self._max_retries):
+                    break
+                retry_after = response.headers.get('Retry-After')
+                if retry_after and retry_after.isdigit():
+                    delay = min(int(retry_after), 30)
+                else:
+                    delay = min(2 ** attempt, 30) + random.uniform(0, 0.5)
+                time.sleep(delay)
+            return response
+        return self.session.request(method, url, **kwargs)
+
     def _make_request(
         self,
         method: str,
@@ -99,21 +351,31 @@ class ContractManagementClient:
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
         files: Optional[Dict] = None,
-        stream: bool = False
+        stream: bool = False,
+        stream_json: bool = False,
+        use_cache: bool = True
     ) -> Any:
         """Make HTTP request to the API"""
-        url = urljoin(self.base_url, endpoint)
-        
-        # Add authentication header
-        headers = {}
-        if self.access_token:
-            headers['Authorization'] = f'Bearer {self.access_token}'
-            
+        self._ensure_session()
+        if stream_json:
+            stream = True
+        # base_url is normalized in __init__ and all endpoints start with '/',
+        # so plain concatenation avoids re-parsing the URL on every call
+        url = self.base_url + endpoint
+
+        # Proactively refresh a token that is about to expire so that
+        # concurrent callers do not each pay a 401 + retry round trip.
+        # Double-checked under a lock so only one thread hits /auth/refresh.
+        if (self.refresh_token and endpoint != '/auth/refresh'
+                and time.time() > self._token_expiry - 30):
+            with self._refresh_lock:
+                if time.time() > self._token_expiry - 30:
+                    self._refresh_access_token()
+
         # Prepare request data
         kwargs = {
             'timeout': self.timeout,
             'verify': self.verify_ssl,
-            'headers': headers,
             'params': params,
             'stream': stream
         }
@@ -121,67 +383,97 @@ class ContractManagementClient:
         if files:
             kwargs['files'] = files
         elif data is not None:
-            kwargs['data'] = json.dumps(data)
-            
+            kwargs['data'] = _dumps(data)
+            kwargs['headers'] = {'Content-Type': 'application/json'}
+            if method == 'POST':
+                # One key per logical write; urllib3-level retries resend
+                # the same header so the server can dedupe replayed POSTs
+                kwargs['headers']['Idempotency-Key'] = str(uuid.uuid4())
+
+        # Revalidate repeat GETs with If-None-Match so unchanged
+        # resources come back as body-less 304s
+        cache_key = None
+        cached = None
+        if use_cache and method == 'GET' and not stream:
+            cache_key = (url, tuple(sorted(params.items())) if params else None)
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                kwargs['headers'] = {'If-None-Match': cached[0]}
+
         try:
-            response = self.session.request(method, url, **kwargs)
-            
+            response = self._request(method, url, **kwargs)
+
             # Handle token refresh
             if response.status_code == 401 and self.refresh_token:
                 self._refresh_access_token()
-                headers['Authorization'] = f'Bearer {self.access_token}'
-                kwargs['headers'] = headers
-                response = self.session.request(method, url, **kwargs)
-                
-            response.raise_for_status()
-            
+                response = self._request(method, url, **kwargs)
+
+            # Serve 304s from the tuple captured before the request; the
+            # cache entry may have been evicted by another thread since
+            if cached is not None and response.status_code == 304:
+                return cached[1]
+
+            # Error responses are the common failure path; branching on the
+            # status avoids a raise/catch round trip per 4xx/5xx
+            if response.status_code >= 400:
+                self._handle_error(response)
+                return None
+
+            if stream_json:
+                # Yield items as they are decoded instead of buffering
+                # the whole list response; list endpoints wrap results
+                # in a {success, data: [...]} envelope
+                if ijson is not None:
+                    response.raw.decode_content = True
+                    return ijson.items(response.raw, 'data.item')
+                return iter(response.json()['data'])
+
             if stream:
                 return response
-                
+
             if response.content:
-                return response.json()
+                body = response.json()
+                if cache_key is not None:
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        if len(self._etag_cache) >= 512:
+                            # Concurrent evictors may race for the same
+                            # first key or empty the dict under us
+                            try:
+                                self._etag_cache.pop(
+                                    next(iter(self._etag_cache)), None
+                                )
+                            except (StopIteration, RuntimeError):
+                                pass
+                        self._etag_cache[cache_key] = (etag, body)
+                return body
             return None
             
-        except requests.exceptions.HTTPError as e:
-            self._handle_error(e.response)
-        except requests.exceptions.ConnectionError as e:
+        except _CONNECTION_ERRORS as e:
             raise NetworkError(f"Connection error: {str(e)}")
-        except requests.exceptions.Timeout as e:
+        except _TIMEOUT_ERRORS as e:
             raise NetworkError(f"Request timeout: {str(e)}")
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             raise APIError(f"Request failed: {str(e)}")
-            
-    def _handle_error(self, response: requests.Response):
+
+    def _handle_error(self, response: Any):
         """Handle API error responses"""
-        try:
-            error_data = response.json()
-            message = error_data.get('message', 'An error occurred')
-            code = error_data.get('code', 'UNKNOWN_ERROR')
-            details = error_data.get('details')
-        except:
-            message = f"HTTP {response.status_code}: {response.text}"
-            code = f"HTTP_{response.status_code}"
-            details = None
-            
-        if response.status_code == 401:
-            raise AuthenticationError(message, code, response.status_code, details)
-        elif response.status_code == 400:
-            raise ValidationError(message, code, response.status_code, details)
-        else:
-            raise APIError(message, code, response.status_code, details)
+        _raise_api_error(response)
             
     def _refresh_access_token(self):
         """Refresh the access token using refresh token"""
         if not self.refresh_token:
             raise AuthenticationError("No refresh token available")
             
-        data = self._make_request('POST', '/auth/refresh', {
+        data = self._post('/auth/refresh', {
             'refreshToken': self.refresh_token
         })
         
         self.access_token = data['accessToken']
         self.refresh_token = data['refreshToken']
-        
+        self._token_expiry = _token_expiry(self.access_token)
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+
     # Authentication Methods
     
     def login(self, email: str, password: str, two_factor_code: Optional[str] = None) -> Dict:
@@ -204,24 +496,30 @@ class ContractManagementClient:
         if two_factor_code:
             data['twoFactorCode'] = two_factor_code
             
-        response = self._make_request('POST', '/auth/login', data)
+        response = self._post('/auth/login', data)
         
         self.access_token = response['accessToken']
         self.refresh_token = response['refreshToken']
-        
+        self._token_expiry = _token_expiry(self.access_token)
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+
         return response
         
     def logout(self):
         """Logout from the system"""
         try:
-            self._make_request('POST', '/auth/logout')
+            self._post('/auth/logout')
         finally:
             self.access_token = None
             self.refresh_token = None
+            self._token_expiry = float('inf')
+            self.session.headers.pop('Authorization', None)
+            # Cached bodies belong to the previous principal
+            self._etag_cache.clear()
             
     def get_current_user(self) -> Dict:
         """Get current user information"""
-        return self._make_request('GET', '/users/me')
+        return self._get('/users/me')
         
     # Contract Methods
     
@@ -264,11 +562,122 @@ class ContractManagementClient:
         if search:
             params['search'] = search
             
-        return self._make_request('GET', '/contracts', params=params)
+        return self._get('/contracts', params=params)
         
+    def iter_contracts(
+        self,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 20,
+        sort_by: str = 'createdAt',
+        sort_order: str = 'desc'
+    ):
+        """
+        Iterate over all matching contracts, paging transparently
+
+        The filter params are built once; only the page number changes
+        between requests.
+        """
+        params = {
+            'page': 1,
+            'limit': limit,
+            'sortBy': sort_by,
+            'sortOrder': sort_order
+        }
+
+        if status:
+            params['status'] = status
+        if type:
+            params['type'] = type
+        if search:
+            params['search'] = search
+
+        while True:
+            response = self._get('/contracts', params=params)
+            data = response.get('data') or {}
+            yield from data.get('contracts') or []
+            pagination = data.get('pagination') or {}
+            if params['page'] >= (pagination.get('pages') or params['page']):
+                break
+            params['page'] += 1
+
     def get_contract(self, contract_id: str) -> Dict:
-        """Get contract by ID"""
-        return self._make_request('GET', f'/contracts/{contract_id}')
+        """
+        Get contract by ID
+
+        Inside a batch() context this returns a Future that resolves
+        when the context exits.
+        """
+        if self._batch is not None:
+            future = Future()
+            self._batch.append((contract_id, future))
+            return future
+        return self._get('/contracts/' + contract_id)
+
+    def get_contracts_batch(self, contract_ids: List[str]) -> List[Dict]:
+        """
+        Get multiple contracts in a single request
+
+        Falls back to one request per ID if the server does not expose
+        the batch endpoint.
+
+        Args:
+            contract_ids: Contract IDs to fetch
+
+        Returns:
+            Contracts in the same order as contract_ids
+        """
+        try:
+            return self._post('/contracts:batchGet', {
+                'ids': contract_ids
+            })
+        except APIError as e:
+            if e.status_code == 404:
+                return [
+                    self._get('/contracts/' + contract_id)
+                    for contract_id in contract_ids
+                ]
+            raise
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce get_contract calls into a single batched request
+
+        Calls to get_contract made inside the context return Futures;
+        on exit one batch request is issued and each Future is resolved
+        from the ordered response.
+
+        Usage:
+            with client.batch():
+                futures = [client.get_contract(cid) for cid in ids]
+            contracts = [f.result() for f in futures]
+        """
+        if self._batch is not None:
+            raise RuntimeError("batch() contexts cannot be nested")
+        self._batch = []
+        try:
+            try:
+                yield self
+            except BaseException as e:
+                # Fail the collected futures so callers blocked on
+                # result() are released rather than waiting forever
+                for _, future in self._batch:
+                    future.set_exception(e)
+                raise
+            pending, self._batch = self._batch, None
+            if pending:
+                try:
+                    results = self.get_contracts_batch([cid for cid, _ in pending])
+                except Exception as e:
+                    for _, future in pending:
+                        future.set_exception(e)
+                    raise
+                for (_, future), result in zip(pending, results):
+                    future.set_result(result)
+        finally:
+            self._batch = None
         
     def create_contract(
         self,
@@ -327,19 +736,24 @@ class ContractManagementClient:
         if tags:
             data['tags'] = tags
             
-        return self._make_request('POST', '/contracts', data)
+        return self._post('/contracts', data)
         
     def update_contract(self, contract_id: str, **kwargs) -> Dict:
         """Update contract"""
-        return self._make_request('PUT', f'/contracts/{contract_id}', kwargs)
+        return self._put('/contracts/' + contract_id, kwargs)
         
     def delete_contract(self, contract_id: str):
         """Delete contract"""
-        self._make_request('DELETE', f'/contracts/{contract_id}')
+        self._delete('/contracts/' + contract_id)
         
     def get_contract_versions(self, contract_id: str) -> List[Dict]:
         """Get contract version history"""
-        return self._make_request('GET', f'/contracts/{contract_id}/versions')
+        return self._get('/contracts/' + contract_id + '/versions')
+
+    def iter_contract_versions(self, contract_id: str):
+        """Stream contract version history, yielding one version at a time"""
+        return self._get('/contracts/' + contract_id + '/versions',
+                         stream_json=True)
         
     def compare_contract_versions(
         self,
@@ -348,7 +762,7 @@ class ContractManagementClient:
         version2: int
     ) -> Dict:
         """Compare two contract versions"""
-        return self._make_request('POST', f'/contracts/{contract_id}/compare', {
+        return self._post('/contracts/' + contract_id + '/compare', {
             'version1': version1,
             'version2': version2
         })
@@ -366,7 +780,7 @@ class ContractManagementClient:
         if message:
             data['message'] = message
             
-        return self._make_request('POST', f'/contracts/{contract_id}/submit-approval', data)
+        return self._post('/contracts/' + contract_id + '/submit-approval', data)
         
     def approve_contract(self, contract_id: str, comments: Optional[str] = None) -> Dict:
         """Approve contract"""
@@ -374,23 +788,28 @@ class ContractManagementClient:
         if comments:
             data['comments'] = comments
             
-        return self._make_request('POST', f'/contracts/{contract_id}/approve', data)
+        return self._post('/contracts/' + contract_id + '/approve', data)
         
     def reject_contract(self, contract_id: str, reason: str) -> Dict:
         """Reject contract"""
-        return self._make_request('POST', f'/contracts/{contract_id}/reject', {
+        return self._post('/contracts/' + contract_id + '/reject', {
             'reason': reason
         })
         
     def sign_contract(self, contract_id: str, signature_data: Dict) -> Dict:
         """Sign contract"""
-        return self._make_request('POST', f'/contracts/{contract_id}/sign', signature_data)
+        return self._post('/contracts/' + contract_id + '/sign', signature_data)
         
     # Comment Methods
     
     def get_comments(self, contract_id: str) -> List[Dict]:
         """Get contract comments"""
-        return self._make_request('GET', f'/contracts/{contract_id}/comments')
+        return self._get('/contracts/' + contract_id + '/comments')
+
+    def iter_comments(self, contract_id: str):
+        """Stream contract comments, yielding one comment at a time"""
+        return self._get('/contracts/' + contract_id + '/comments',
+                         stream_json=True)
         
     def add_comment(
         self,
@@ -410,7 +829,7 @@ class ContractManagementClient:
         if mentions:
             data['mentions'] = mentions
             
-        return self._make_request('POST', f'/contracts/{contract_id}/comments', data)
+        return self._post('/contracts/' + contract_id + '/comments', data)
         
     def update_comment(
         self,
@@ -419,13 +838,13 @@ class ContractManagementClient:
         content: str
     ) -> Dict:
         """Update comment"""
-        return self._make_request('PUT', f'/contracts/{contract_id}/comments/{comment_id}', {
+        return self._put('/contracts/' + contract_id + '/comments/' + comment_id, {
             'content': content
         })
         
     def delete_comment(self, contract_id: str, comment_id: str):
         """Delete comment"""
-        self._make_request('DELETE', f'/contracts/{contract_id}/comments/{comment_id}')
+        self._delete('/contracts/' + contract_id + '/comments/' + comment_id)
         
     # Template Methods
     
@@ -450,11 +869,40 @@ class ContractManagementClient:
         if search:
             params['search'] = search
             
-        return self._make_request('GET', '/templates', params=params)
+        return self._get('/templates', params=params)
         
+    def iter_templates(
+        self,
+        category: Optional[str] = None,
+        is_public: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 20
+    ):
+        """Iterate over all matching templates, paging transparently"""
+        params = {
+            'page': 1,
+            'limit': limit
+        }
+
+        if category:
+            params['category'] = category
+        if is_public is not None:
+            params['isPublic'] = is_public
+        if search:
+            params['search'] = search
+
+        while True:
+            response = self._get('/templates', params=params)
+            data = response.get('data') or {}
+            yield from data.get('templates') or []
+            pagination = data.get('pagination') or {}
+            if params['page'] >= (pagination.get('pages') or params['page']):
+                break
+            params['page'] += 1
+
     def get_template(self, template_id: str) -> Dict:
         """Get template by ID"""
-        return self._make_request('GET', f'/templates/{template_id}')
+        return self._get('/templates/' + template_id)
         
     def create_template(
         self,
@@ -484,15 +932,15 @@ class ContractManagementClient:
         if price is not None:
             data['price'] = price
             
-        return self._make_request('POST', '/templates', data)
+        return self._post('/templates', data)
         
     def update_template(self, template_id: str, **kwargs) -> Dict:
         """Update template"""
-        return self._make_request('PUT', f'/templates/{template_id}', kwargs)
+        return self._put('/templates/' + template_id, kwargs)
         
     def delete_template(self, template_id: str):
         """Delete template"""
-        self._make_request('DELETE', f'/templates/{template_id}')
+        self._delete('/templates/' + template_id)
         
     # File Operations
     
@@ -515,84 +963,146 @@ class ContractManagementClient:
         Returns:
             Uploaded attachment info
         """
-        import os
-        
         if not os.path.exists(file_path):
             raise ValueError(f"File not found: {file_path}")
-            
-        file_size = os.path.getsize(file_path)
-        
+
+        if not filename:
+            filename = os.path.basename(file_path)
+
         with open(file_path, 'rb') as f:
-            if not filename:
-                filename = os.path.basename(file_path)
-                
-            files = {'file': (filename, f)}
-            
-            # Note: Progress tracking requires custom implementation
-            return self._make_request(
-                'POST',
-                f'/contracts/{contract_id}/attachments',
-                files=files
-            )
+            if MultipartEncoder is None:
+                # requests-toolbelt not installed; requests buffers the
+                # whole multipart body in memory before sending
+                return self._make_request(
+                    'POST',
+                    '/contracts/' + contract_id + '/attachments',
+                    files={'file': (filename, f)}
+                )
+
+            # Stream the multipart body from disk so memory stays at
+            # socket-buffer size regardless of attachment size. The
+            # encoder is forward-only, so the 401 retry rewinds the file
+            # and builds a fresh one.
+            def _encoder():
+                body = MultipartEncoder(
+                    fields={'file': (filename, f, 'application/octet-stream')}
+                )
+                if progress_callback:
+                    body = MultipartEncoderMonitor(
+                        body,
+                        lambda monitor: progress_callback(monitor.bytes_read)
+                    )
+                return body
+
+            url = self.base_url + '/contracts/' + contract_id + '/attachments'
+
+            # Proactive single-flight refresh, as in _make_request
+            if self.refresh_token and time.time() > self._token_expiry - 30:
+                with self._refresh_lock:
+                    if time.time() > self._token_expiry - 30:
+                        self._refresh_access_token()
+
+            try:
+                self._ensure_session()
+                body = _encoder()
+                headers = dict(self.session.headers)
+                headers['Content-Type'] = body.content_type
+                response = self._upload_session.post(
+                    url,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl
+                )
+
+                # Handle token refresh
+                if response.status_code == 401 and self.refresh_token:
+                    self._refresh_access_token()
+                    f.seek(0)
+                    body = _encoder()
+                    headers = dict(self.session.headers)
+                    headers['Content-Type'] = body.content_type
+                    response = self._upload_session.post(
+                        url,
+                        data=body,
+                        headers=headers,
+                        timeout=self.timeout,
+                        verify=self.verify_ssl
+                    )
+
+                if response.status_code >= 400:
+                    self._handle_error(response)
+                    return None
+                return response.json()
+            except requests.exceptions.ConnectionError as e:
+                raise NetworkError(f"Connection error: {str(e)}")
+            except requests.exceptions.Timeout as e:
+                raise NetworkError(f"Request timeout: {str(e)}")
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Request failed: {str(e)}")
             
     def download_attachment(
         self,
         contract_id: str,
         attachment_id: str,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        chunk_size: int = 65536
     ) -> str:
         """
         Download attachment
-        
+
         Args:
             contract_id: Contract ID
             attachment_id: Attachment ID
             output_path: Optional output file path
-            
+            chunk_size: Copy buffer size in bytes
+
         Returns:
             Path to downloaded file
         """
         response = self._make_request(
             'GET',
-            f'/contracts/{contract_id}/attachments/{attachment_id}',
+            '/contracts/' + contract_id + '/attachments/' + attachment_id,
             stream=True
         )
         
         if not output_path:
             # Extract filename from headers
-            import re
             content_disposition = response.headers.get('content-disposition', '')
-            filename_match = re.search(r'filename="?([^"]+)"?', content_disposition)
+            filename_match = _FILENAME_RE.search(content_disposition)
             filename = filename_match.group(1) if filename_match else f'attachment_{attachment_id}'
             output_path = filename
-            
+
+        # Copy socket -> file directly, skipping iter_content's
+        # per-chunk reassembly
+        response.raw.decode_content = True
         with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                
+            shutil.copyfileobj(response.raw, f, length=chunk_size)
+
         return output_path
         
     def export_contract(
         self,
         contract_id: str,
         format: str = 'pdf',
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        chunk_size: int = 65536
     ) -> str:
         """Export contract to file"""
         response = self._make_request(
             'GET',
-            f'/contracts/{contract_id}/export',
+            '/contracts/' + contract_id + '/export',
             params={'format': format},
             stream=True
         )
         
         if not output_path:
             output_path = f'contract_{contract_id}.{format}'
-            
+
+        response.raw.decode_content = True
         with open(output_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                
+            shutil.copyfileobj(response.raw, f, length=chunk_size)
+
         return output_path
         
     # Analytics Methods
@@ -610,17 +1120,23 @@ class ContractManagementClient:
         if end_date:
             params['endDate'] = end_date.isoformat()
             
-        return self._make_request('GET', '/analytics/dashboard', params=params)
+        return self._get('/analytics/dashboard', params=params)
         
     def get_contract_analytics(self, contract_id: str) -> Dict:
         """Get contract analytics"""
-        return self._make_request('GET', f'/analytics/contracts/{contract_id}')
+        return self._get('/analytics/contracts/' + contract_id)
         
     # Utility Methods
     
     def search_contracts(self, query: str) -> List[Dict]:
         """Search contracts"""
-        return self._make_request('GET', '/contracts/search', params={'q': query})
+        return self._get('/contracts/search', params={'q': query},
+                         use_cache=False)
+
+    def iter_search_contracts(self, query: str):
+        """Stream search results, yielding one contract at a time"""
+        return self._get('/contracts/search', params={'q': query},
+                         stream_json=True)
         
     def bulk_update_contracts(
         self,
@@ -628,7 +1144,7 @@ class ContractManagementClient:
         updates: Dict
     ) -> List[Dict]:
         """Bulk update contracts"""
-        return self._make_request('POST', '/contracts/bulk-update', {
+        return self._post('/contracts/bulk-update', {
             'contractIds': contract_ids,
             'updates': updates
         })
@@ -22,4 +22,11 @@ __all__ = [
     'ValidationError',
     'NetworkError',
     '__version__'
-]
\ No newline at end of file
+]
+
+try:
+    from .async_client import AsyncContractManagementClient
+    __all__.append('AsyncContractManagementClient')
+except ImportError:
+    # httpx not installed; the async client is optional
+    pass
\ No newline at end of file
@@ -39,6 +39,17 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     extras_require={
+        "compression": [
+            "brotli",
+            "zstandard",
+        ],
+        "http2": [
+            "httpx[http2]>=0.28.0",
+        ],
+        "streaming": [
+            "requests-toolbelt>=1.0.0",
+            "ijson>=3.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",